@@ -7,7 +7,7 @@
 # 큰 덩어리: 차트가 보이고 RSI 숫자가 움직이는 화면 하나 만들기
 # 오늘은 이것에 직접 도움 되는 것만 만진다
 # =========================================================
-# 1.SEC:IMPORTS       기본 import + matplotlib
+# 1.SEC:IMPORTS       기본 import (matplotlib/requests는 처음 쓸 때 import)
 # 2.SEC:CONSTANTS     버전/폰트/기본값
 # 3.SEC:CONFIG        DashboardConfig
 # 4.SEC:RUNCONTEXT    DashboardContext
@@ -28,19 +28,35 @@ from __future__ import annotations
 
 import json
 import logging
+import math
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Optional, Literal
-from datetime import datetime
+from collections.abc import Sequence
+from typing import TYPE_CHECKING, Optional, Literal, Union
+from datetime import datetime, timedelta, timezone
 import time
-import matplotlib.ticker as mticker
-import requests
+import numpy as np
+
+try:
+    import orjson  # C 구현 JSON 파서 (있으면 사용)
+except ImportError:
+    orjson = None
 
 import tkinter as tk
 from tkinter import ttk
 
-from matplotlib.figure import Figure
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+# matplotlib / requests 는 import 비용이 커서 ChartEngine.init_figure / DataEngine.__init__ 에서 import
+# (config / 헬스체크 / 스냅샷만 쓰는 경로는 이 비용을 내지 않는다). 여기는 타입 표기용.
+if TYPE_CHECKING:
+    from matplotlib.axes import Axes
+    from matplotlib.figure import Figure
+    from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+    from matplotlib.collections import LineCollection, PolyCollection
+    from matplotlib.legend import Legend
+    from matplotlib.lines import Line2D
+    from matplotlib.text import Text
 
 def is_dev() -> bool:
     # DEV 모드 여부를 반환 (환경변수/설정 등으로 확장 가능)
@@ -62,6 +78,67 @@ DEFAULT_SYMBOLS = ["KRW-BTC", "KRW-ETH", "KRW-XRP"]
 DEFAULT_TIMEFRAMES = ["1", "3", "5", "15", "60"]
 DEFAULT_MODE: Literal["DEV_LOCAL", "PAPER", "LIVE"] = "DEV_LOCAL"
 
+# 타임프레임별 캔들 요청을 동시에 보내는 워커 수
+FETCH_MAX_WORKERS = 8
+
+# 업비트 분봉 단위 (그 외 TF는 일봉)
+MINUTE_TIMEFRAMES = {"1", "3", "5", "10", "15", "30", "60", "240"}
+
+# 캔들 캐시 크기 / 증분 요청 크기 (최근 몇 개를 겹쳐 받아서 캐시에 이어 붙임)
+CANDLE_FETCH_COUNT = 200
+CANDLE_DELTA_COUNT = 3
+
+# 캔들 경계가 안 바뀌어도 이 시간이 지나면 다시 받는다 (진행 중 캔들의 현재가 반영용)
+CANDLE_MAX_STALE_SEC = 5.0
+
+# 업비트 요청 재시도: 429/5xx 와 연결 오류만 짧게 (Retry-After 헤더는 그대로 따름)
+HTTP_RETRY_TOTAL = 2
+HTTP_RETRY_BACKOFF = 0.2
+
+# 캔들 경계 직후 거래소에 새 캔들이 잡힐 때까지의 여유
+CANDLE_BOUNDARY_EPS_SEC = 0.3
+
+# 데이터 갱신 예약 간격: 다음 갱신 시점까지 기다리되, 심볼 변경에 반응하도록 최대 3초
+DATA_REFRESH_MIN_MS = 200
+DATA_REFRESH_MAX_MS = 3000
+
+# UI 틱 간격 (새 데이터는 <<CandleTick>>으로 바로 반영, 이 주기는 심볼/TF 변경 반영용)
+UI_REFRESH_MS = 1000
+
+# 백그라운드 데이터 갱신이 끝났는지 Tk 스레드에서 확인하는 간격
+DATA_POLL_MS = 50
+
+# 차트 dpi: 캔버스가 창 크기에 맞춰 늘어나므로(fill/expand) 픽셀 수는 위젯 크기로 정해지고,
+# dpi는 같은 크기 위의 글자/선 굵기(pt)만 바꾼다
+DEFAULT_CHART_DPI = 100
+
+# RSI 구간 경계 / 구간별 (표시 문구, 게이지 스타일): 0=과매도, 1=중립, 2=과매수
+RSI_OVERSOLD = 30.0
+RSI_OVERBOUGHT = 70.0
+RSI_ZONES = (
+    ("과매도", "RSI.Cold.Horizontal.TProgressbar"),
+    ("중립", "RSI.Neutral.Horizontal.TProgressbar"),
+    ("과매수", "RSI.Hot.Horizontal.TProgressbar"),
+)
+
+# RSI 게이지 값은 이 이상 움직였을 때만 다시 넣는다
+RSI_BAR_MIN_DELTA = 0.1
+
+# 데이터 상태 라벨 템플릿 (상태 → format 문자열). 입력이 바뀐 틱에서만 format 한다
+DATA_STATUS_FORMATS = {
+    "CACHE_MISS": "CACHE MISS — {market} / TF {tf}",
+    "HTTP_FAIL": "HTTP FAIL — {detail}",
+    "EMPTY": "NO DATA — EMPTY ({market} / TF {tf})",
+    "BAD_VALUES": "BAD VALUES — 유효 price 0 ({market} / TF {tf})",
+    "OK": "DATA OK — {valid}/{total} candles / last {detail}",
+}
+
+# 같은 심볼/TF 차트를 다시 그리는 최소 간격(초). 숫자 라벨은 매 틱, 차트는 이 간격으로
+DEFAULT_CHART_MIN_INTERVAL_SEC = 2.0
+
+# 캐시에 보관하는 OHLC 배열 정밀도: 표시/지표용이라 float32면 충분 (메모리·복사량 절반)
+PRICE_DTYPE = np.float32
+
 
 # =========================================================
 # [SEC:CONFIG] ⚙️ DashboardConfig
@@ -73,6 +150,8 @@ class DashboardConfig:
     symbols: list[str] = field(default_factory=lambda: DEFAULT_SYMBOLS.copy())
     timeframes: list[str] = field(default_factory=lambda: DEFAULT_TIMEFRAMES.copy())
     mode: str = DEFAULT_MODE
+    chart_dpi: int = DEFAULT_CHART_DPI
+    chart_min_interval_sec: float = DEFAULT_CHART_MIN_INTERVAL_SEC
 
     @classmethod
     def load(cls, path: Path = DEFAULT_CONFIG_PATH) -> "DashboardConfig":
@@ -90,6 +169,8 @@ class DashboardConfig:
             symbols=data.get("symbols", DEFAULT_SYMBOLS),
             timeframes=data.get("timeframes", DEFAULT_TIMEFRAMES),
             mode=data.get("mode", DEFAULT_MODE),
+            chart_dpi=data.get("chart_dpi", DEFAULT_CHART_DPI),
+            chart_min_interval_sec=data.get("chart_min_interval_sec", DEFAULT_CHART_MIN_INTERVAL_SEC),
         )
 
 
@@ -177,22 +258,193 @@ class SnapshotManager:
         }
         ts = datetime.now().strftime("%Y%m%d_%H%M%S")
         path = self.snapshot_dir / f"snapshot_{ts}.json"
-        with path.open("w", encoding="utf-8") as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
+
+        # bytes로 한 번에 직렬화 → 한 번에 쓰기 (한글은 그대로, 들여쓰기 2칸)
+        if orjson is not None:
+            payload = orjson.dumps(data, option=orjson.OPT_INDENT_2)
+        else:
+            payload = json.dumps(data, ensure_ascii=False, indent=2).encode("utf-8")
+        path.write_bytes(payload)
         return path
 
 
 # =========================================================
 # [SEC:DATA_PIPELINE] 🔗 DataEngine / IndicatorEngine
 # =========================================================
+def _to_float_nan(val) -> float:
+    """
+    float 변환을 시도하고, 실패하면 NaN을 반환한다.
+    Upbit API의 None, '', '0E-8' 같은 값도 안전하게 처리.
+    """
+    if val is None:
+        return np.nan
+    try:
+        return float(val)
+    except (TypeError, ValueError):
+        return np.nan
+
+
+def _build_candle_arrays(candles: list[dict]) -> dict[str, np.ndarray]:
+    """
+    캔들 dict 리스트를 OHLC/시간 배열로 한 번에 변환.
+    - "o","h","l","c": float64 (깨진 값은 NaN)
+    - "t": KST(없으면 UTC) 시간 문자열 (object)
+    - "hm": 차트 x축 라벨용 "HH:MM" (U5, 형식이 이상하면 "")
+    """
+    n = len(candles)
+    t_raw = [c.get("candle_date_time_kst") or c.get("candle_date_time_utc") for c in candles]
+    return {
+        "o": np.fromiter((_to_float_nan(c.get("opening_price")) for c in candles), np.float64, n),
+        "h": np.fromiter((_to_float_nan(c.get("high_price")) for c in candles), np.float64, n),
+        "l": np.fromiter((_to_float_nan(c.get("low_price")) for c in candles), np.float64, n),
+        "c": np.fromiter((_to_float_nan(c.get("trade_price")) for c in candles), np.float64, n),
+        "t": np.array(t_raw, dtype=object),
+        # "YYYY-MM-DDTHH:MM:SS" -> "HH:MM" (캔들이 들어올 때 한 번만 자른다)
+        "hm": np.array(
+            [(t[11:16] if isinstance(t, str) and len(t) >= 16 else "") for t in t_raw],
+            dtype="U5",
+        ),
+    }
+
+
+def _tf_seconds(tf: str) -> int:
+    """타임프레임 한 칸의 길이(초). 분봉이 아니면 일봉."""
+    tf_str = str(tf).upper().strip()
+    if tf_str in MINUTE_TIMEFRAMES:
+        return int(tf_str) * 60
+    return 24 * 60 * 60
+
+
+def _next_candle_boundary(candle: dict, tf: str) -> datetime | None:
+    """마지막 캔들 시작 시각(UTC) + TF 길이 = 다음 캔들이 열리는 시각."""
+    t_raw = candle.get("candle_date_time_utc")
+    if not isinstance(t_raw, str):
+        return None
+    try:
+        start = datetime.fromisoformat(t_raw).replace(tzinfo=timezone.utc)
+    except ValueError:
+        return None
+    return start + timedelta(seconds=_tf_seconds(tf))
+
+
+def _merge_cut(old: list[dict], new: list[dict]) -> int | None:
+    """
+    과거 → 최신 순 캔들 리스트 old 뒤에 증분 new를 시간 기준으로 이어 붙일 위치.
+    - old[:cut] + new 가 합쳐진 결과 (new 첫 캔들 이후의 old 캔들은 new로 교체 = 진행 중 캔들 갱신)
+    - new가 old 끝과 겹치지 않으면(중간 공백) None → 전체 재요청 필요
+    """
+    if not new:
+        return len(old)
+
+    def key(c: dict) -> str:
+        return c.get("candle_date_time_utc") or c.get("candle_date_time_kst") or ""
+
+    first_new = key(new[0])
+    if not old or first_new > key(old[-1]):
+        return None
+
+    cut = len(old)
+    while cut > 0 and key(old[cut - 1]) >= first_new:
+        cut -= 1
+    return cut
+
+
+class _CandleBuffer:
+    """
+    (market, tf) 하나의 OHLC/시간 배열을 미리 잡아 둔 버퍼 2개에 번갈아 쓴다.
+    - 매 갱신마다 200개 dict를 다시 파싱/할당하지 않고, 유지되는 행은 복사 + 새 캔들만 변환
+    - 직전 엔트리가 보고 있는 버퍼는 건드리지 않는다 (읽는 쪽과 겹치지 않게)
+    - 반환 배열은 버퍼의 view: "o","h","l","c" 각각 연속 메모리 (4, capacity) 행, PRICE_DTYPE
+    """
+
+    def __init__(self, capacity: int = CANDLE_FETCH_COUNT) -> None:
+        self.capacity = capacity
+        self._ohlc = [np.empty((4, capacity), dtype=PRICE_DTYPE) for _ in range(2)]
+        self._t = [np.empty(capacity, dtype=object) for _ in range(2)]
+        self._hm = [np.empty(capacity, dtype="U5") for _ in range(2)]
+        self._front = 0
+        self._size = 0
+        # ↙ 전체 다시 채울 때마다 +1. 이어 붙인 배열은 같은 값 → 증분 지표 상태를 이어 써도 된다
+        self.generation = 0
+
+    def _publish(self, size: int) -> dict[str, np.ndarray]:
+        self._size = size
+        ohlc = self._ohlc[self._front]
+        return {
+            "o": ohlc[0, :size],
+            "h": ohlc[1, :size],
+            "l": ohlc[2, :size],
+            "c": ohlc[3, :size],
+            "t": self._t[self._front][:size],
+            "hm": self._hm[self._front][:size],
+        }
+
+    def load(self, candles: list[dict]) -> dict[str, np.ndarray]:
+        """전체 캔들로 다시 채운다 (최초/전체 재요청)."""
+        self.generation += 1
+        return self.splice(0, candles)
+
+    def splice(self, cut: int, new: list[dict]) -> dict[str, np.ndarray]:
+        """현재 배열[:cut] + new 를 뒤쪽 capacity개만 남겨서 반대편 버퍼에 쓴다."""
+        new = new[-self.capacity:]
+        cut = min(cut, self._size)
+        keep_from = max(0, cut + len(new) - self.capacity)
+        keep = cut - keep_from
+
+        front, back = self._front, 1 - self._front
+        dst_ohlc, dst_t, dst_hm = self._ohlc[back], self._t[back], self._hm[back]
+
+        dst_ohlc[:, :keep] = self._ohlc[front][:, keep_from:cut]
+        dst_t[:keep] = self._t[front][keep_from:cut]
+        dst_hm[:keep] = self._hm[front][keep_from:cut]
+        if new:
+            parsed = _build_candle_arrays(new)
+            end = keep + len(new)
+            for row, k in enumerate(("o", "h", "l", "c")):
+                dst_ohlc[row, keep:end] = parsed[k]
+            dst_t[keep:end] = parsed["t"]
+            dst_hm[keep:end] = parsed["hm"]
+
+        self._front = back
+        return self._publish(keep + len(new))
+
+
 class DataEngine:
     """업비트 시세/캔들 데이터를 가져오는 캐시 엔진."""
 
     def __init__(self, cfg: DashboardConfig) -> None:
         self.cfg = cfg
         self._cache: dict[tuple[str, str], dict] = {}
+        self._buffers: dict[tuple[str, str], _CandleBuffer] = {}
+        self._lock = threading.Lock()
+        # 요청 대기(소켓 I/O) 중에는 GIL이 풀리므로 TF별 요청을 스레드로 겹쳐서 보낸다
+        self._fetch_pool = ThreadPoolExecutor(
+            max_workers=FETCH_MAX_WORKERS, thread_name_prefix="candle-fetch"
+        )
+        import requests
+        from requests.adapters import HTTPAdapter
+        from urllib3.util.retry import Retry
+
+        # 세션 하나로 keep-alive 연결을 재사용 (매 요청 TCP+TLS 핸드셰이크 생략)
+        # 풀 크기 = 워커 수 → 동시 요청이 커넥션을 버리지 않고 돌려쓴다
+        self._session = requests.Session()
+        retry = Retry(
+            total=HTTP_RETRY_TOTAL,
+            backoff_factor=HTTP_RETRY_BACKOFF,
+            status_forcelist=(429, 500, 502, 503, 504),
+            allowed_methods=frozenset({"GET"}),
+            raise_on_status=False,  # 재시도 후에도 실패면 응답 그대로 → 아래 HTTP 오류 로그 경로
+        )
+        adapter = HTTPAdapter(
+            pool_connections=FETCH_MAX_WORKERS,
+            pool_maxsize=FETCH_MAX_WORKERS,
+            max_retries=retry,
+        )
+        self._session.mount("https://", adapter)
 
-    def _fetch_candles_from_api(self, market: str, tf: str, count: int = 200) -> list[dict]:
+    def _fetch_candles_from_api(
+        self, market: str, tf: str, count: int = CANDLE_FETCH_COUNT
+    ) -> list[dict]:
         """
         업비트 실제 캔들 API 호출.
         - 분봉(tf: "1","3","5","10","15","30","60","240")은 /v1/candles/minutes/{tf}
@@ -203,7 +455,7 @@ class DataEngine:
         base_url = "https://api.upbit.com/v1/candles"
 
         tf_str = str(tf).upper().strip()
-        if tf_str in {"1", "3", "5", "10", "15", "30", "60", "240"}:
+        if tf_str in MINUTE_TIMEFRAMES:
             url = f"{base_url}/minutes/{int(tf_str)}"
             params = {"market": market, "count": count}
         else:
@@ -211,7 +463,7 @@ class DataEngine:
             params = {"market": market, "count": count}
 
         try:
-            resp = requests.get(url, params=params, timeout=3.0)
+            resp = self._session.get(url, params=params, timeout=3.0)
         except Exception as e:
             logging.error("캔들 요청 실패(네트워크): market=%s tf=%s err=%s", market, tf, e)
             return self._cache.get((market, tf), {}).get("candles", [])
@@ -227,7 +479,7 @@ class DataEngine:
             return self._cache.get((market, tf), {}).get("candles", [])
 
         try:
-            data = resp.json()
+            data = orjson.loads(resp.content) if orjson is not None else resp.json()
         except Exception as e:
             logging.error("캔들 응답 JSON 파싱 실패: %s", e)
             return self._cache.get((market, tf), {}).get("candles", [])
@@ -236,72 +488,367 @@ class DataEngine:
             logging.error("캔들 응답 형식 이상: %r", data)
             return self._cache.get((market, tf), {}).get("candles", [])
 
-        # 최신 → 과거 → reverse 해서 과거 → 최신
-        candles: list[dict] = list(reversed(data))
+        # 최신 → 과거 → 제자리 reverse 해서 과거 → 최신 (리스트 복사 없음)
+        data.reverse()
+        candles: list[dict] = data
         return candles
 
-    def refresh_all(self, market: str, tfs: list[str]) -> None:
+    def refresh_all(self, market: str, tfs: list[str]) -> bool:
         """주기적으로 현재 선택 심볼에 대해 여러 타임프레임 캔들 갱신.
         - 캐시에 fetch_ok / fetch_error를 반드시 기록해서
         UI에서 NO DATA 원인 3분리(CACHE MISS / HTTP FAIL / BAD VALUES)가 가능해진다.
+        - 새로 받은 엔트리가 하나라도 있으면 True
         """
-        for tf in tfs:
-            fetch_ok = False
-            fetch_error: str | None = None
-            candles: list[dict] = []
+        # TF별 요청을 동시에 보내서 전체 소요 시간을 RTT 한 번 수준으로
+        entries = list(self._fetch_pool.map(lambda tf: self._fetch_entry(market, tf), tfs))
+
+        # ✅ 항상 캐시 엔트리를 남긴다 (MISS/FAIL/OK 모두 추적)
+        changed = False
+        with self._lock:
+            for tf, entry in zip(tfs, entries):
+                changed = changed or entry is not self._cache.get((market, tf))
+                self._cache[(market, tf)] = entry
+        return changed
+
+    def _fetch_entry(self, market: str, tf: str) -> dict:
+        """한 타임프레임 캔들을 가져와서 캐시 엔트리 dict로 만든다 (워커 스레드에서 실행).
+        - 갱신 시점이 아니면 기존 엔트리를 그대로 반환 (요청 없음)
+        - 기존 캔들이 있으면 최근 CANDLE_DELTA_COUNT개만 받아서 이어 붙인다
+        """
+        prev = self._cache.get((market, tf))
+        if prev is not None and not self._is_due(prev, tf):
+            return prev
+
+        fetch_ok = False
+        fetch_error: str | None = None
+        candles: list[dict] = []
+        buf = self._buffers.get((market, tf))
+        if buf is None:
+            buf = self._buffers[(market, tf)] = _CandleBuffer()
+        arr: dict[str, np.ndarray] | None = None
 
-            try:
+        try:
+            if prev is not None and prev["fetch_ok"] and prev["candles"]:
+                delta = self._fetch_candles_from_api(market, tf, count=CANDLE_DELTA_COUNT)
+                cut = _merge_cut(prev["candles"], delta)
+                if cut is not None:
+                    candles = (prev["candles"][:cut] + delta)[-CANDLE_FETCH_COUNT:]
+                    arr = buf.splice(cut, delta)
+            # 캐시가 없거나, 증분이 기존 캔들과 안 겹치면(공백) 전체 다시 받기
+            if arr is None:
                 candles = self._fetch_candles_from_api(market, tf)
-                fetch_ok = True
-            except Exception as e:
-                fetch_ok = False
-                fetch_error = f"{type(e).__name__}: {e}"
-                logging.error("캔들 조회 오류: market=%s tf=%s err=%s", market, tf, fetch_error)
-
-            # ✅ 항상 캐시 엔트리를 남긴다 (MISS/FAIL/OK 모두 추적)
-            self._cache[(market, tf)] = {
-                "candles": candles,
-                "last_refresh": datetime.now(),
-                "fetch_ok": fetch_ok,
-                "fetch_error": fetch_error,
-            }
+                arr = buf.load(candles)
+            fetch_ok = True
+        except Exception as e:
+            fetch_ok = False
+            fetch_error = f"{type(e).__name__}: {e}"
+            logging.error("캔들 조회 오류: market=%s tf=%s err=%s", market, tf, fetch_error)
+
+        if arr is None:
+            arr = buf.load(candles)
+
+        # "arr": 지표/차트가 매 틱 dict를 다시 파싱하지 않도록 OHLC 배열을 같이 보관
+        # "gen": arr를 전체 다시 채운 횟수 (같으면 앞 엔트리 배열에 증분만 이어 붙인 것)
+        return {
+            "candles": candles,
+            "arr": arr,
+            "gen": buf.generation,
+            "last_refresh": datetime.now(),
+            "fetch_ok": fetch_ok,
+            "fetch_error": fetch_error,
+        }
 
+    def _due_in(self, entry: dict | None, tf: str) -> float:
+        """캐시 엔트리를 다시 받아야 할 때까지 남은 초 (0 이하 = 지금).
+        - 실패/빈 캐시는 바로, 아니면 오래됨(CANDLE_MAX_STALE_SEC)과 다음 캔들 경계 중 빠른 쪽
+        - 경계가 지난 뒤 이미 한 번 받았으면(새 캔들 아직 없음) 오래됨 기준만
+        """
+        if entry is None or not entry["fetch_ok"] or not entry["candles"]:
+            return 0.0
+
+        age = (datetime.now() - entry["last_refresh"]).total_seconds()
+        stale_in = CANDLE_MAX_STALE_SEC - age
+
+        boundary = _next_candle_boundary(entry["candles"][-1], tf)
+        if boundary is None:
+            return 0.0
+        if entry["last_refresh"].astimezone(timezone.utc) >= boundary:
+            # 경계 뒤에 이미 받았는데도 새 캔들이 없음(거래 없음/시계 앞섬/거래소 지연)
+            #   → 경계는 무시하고 오래됨 기준으로만 (200ms 폴링 루프 방지)
+            return stale_in
+        boundary_in = (boundary - datetime.now(timezone.utc)).total_seconds() + CANDLE_BOUNDARY_EPS_SEC
+        return min(stale_in, boundary_in)
+
+    def _is_due(self, entry: dict, tf: str) -> bool:
+        """캐시 엔트리를 다시 받아야 하는지: 실패/빈 캐시, 오래됨, 또는 캔들 경계가 지남."""
+        return self._due_in(entry, tf) <= 0.0
+
+    def seconds_until_due(self, market: str, tfs: list[str]) -> float:
+        """여러 타임프레임 중 가장 먼저 갱신이 필요한 시점까지 남은 초 (0 이상)."""
+        if not tfs:
+            return CANDLE_MAX_STALE_SEC
+        due = min(self._due_in(self._cache.get((market, tf)), tf) for tf in tfs)
+        return max(0.0, due)
 
     def get(self, market: str, tf: str) -> dict | None:
         """특정 심볼/타임프레임의 캐시된 데이터 반환."""
         return self._cache.get((market, tf))
 
+    def close(self) -> None:
+        """요청 스레드 풀/세션 정리 (창 닫을 때). 대기 중인 요청은 취소하고 기다리지 않는다."""
+        self._fetch_pool.shutdown(wait=False, cancel_futures=True)
+        self._session.close()
 
-def calc_rsi(closes: list[float], period: int = 14) -> float | None:
-    """단순 RSI 계산 (Wilder 방식 근사)."""
-    if len(closes) < period + 1:
+
+# 지표 함수 입력: float 리스트/튜플 또는 캐시의 float32/float64 배열
+FloatSeries = Union[Sequence[float], np.ndarray]
+
+
+def _as_float_array(x: FloatSeries) -> np.ndarray:
+    """float32/float64 배열은 그대로(복사 없음), 그 외(list 등)는 float64 배열로."""
+    a = np.asarray(x)
+    if a.dtype == np.float32 or a.dtype == np.float64:
+        return a
+    return a.astype(np.float64)
+
+
+def _iir1(u: np.ndarray, a: float, y0: float) -> np.ndarray:
+    """
+    1차 재귀식 y[i] = a * y[i-1] + u[i] (y[-1] = y0) 를 파이썬 루프 없이 푼다.
+    - 닫힌 형태: y[i] = a^(i+1) * (y0 + sum_{j<=i} u[j] / a^(j+1))
+    - a^-j 가 u.dtype(float32/float64) 범위를 넘지 않도록 블록 단위로 잘라서 누적
+    - 결과는 u와 같은 dtype
+    """
+    out = np.empty(u.size, dtype=u.dtype)
+    if u.size == 0:
+        return out
+    if a <= 0.0:
+        out[:] = u
+        return out
+
+    # 10^max_exp 직전까지 (float64 ≈ 300자리, float32 ≈ 30자리)
+    max_exp = np.log10(np.finfo(u.dtype).max) - 8.0
+    block = u.size if a >= 1.0 else max(1, int(max_exp / -np.log10(a)))
+    prev = float(y0)
+    for start in range(0, u.size, block):
+        seg = u[start:start + block]
+        decay = a ** np.arange(1, seg.size + 1, dtype=u.dtype)
+        out[start:start + seg.size] = decay * (prev + np.cumsum(seg / decay))
+        prev = float(out[start + seg.size - 1])
+    return out
+
+
+def _wilder_rma(x: np.ndarray, n: int) -> np.ndarray:
+    """
+    Wilder 평활(RMA): 처음 n개 평균으로 시작해서
+    avg = (avg * (n - 1) + x) / n 를 이어간다. 길이는 len(x) - n + 1.
+    """
+    seed = x[:n].mean()
+    out = np.empty(x.size - n + 1, dtype=x.dtype)
+    out[0] = seed
+    out[1:] = _iir1(x[n:] / n, (n - 1) / n, seed)
+    return out
+
+
+def _ema(x: np.ndarray, period: int) -> np.ndarray:
+    """EMA (k = 2 / (period + 1)), 첫 값으로 시작: y[i] = k * x[i] + (1 - k) * y[i-1]."""
+    k = 2 / (period + 1)
+    out = np.empty(x.size, dtype=x.dtype)
+    if x.size == 0:
+        return out
+    out[0] = x[0]
+    out[1:] = _iir1(k * x[1:], 1 - k, x[0])
+    return out
+
+
+def calc_macd_series(
+    closes,
+    short: int = 12,
+    long: int = 26,
+    signal: int = 9,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """MACD / Signal / Histogram 시계열. 지표 엔진과 차트가 같이 쓰는 단일 구현."""
+    a = _as_float_array(closes)
+    if a.size == 0:
+        return a[:0], a[:0], a[:0]
+
+    # EMA는 상수 이동에 선형이라 첫 값을 빼고 계산해도 MACD(두 EMA의 차)는 같다.
+    # 수천만 원대 가격의 두 EMA를 그대로 빼면 float32에서 자릿수가 날아가므로 기준을 0 근처로
+    d = a - a[0]
+    macd_line = _ema(d, short) - _ema(d, long)
+    signal_line = _ema(macd_line, signal)
+    return macd_line, signal_line, macd_line - signal_line
+
+
+# ↙ 스칼라 루프 → 컴파일이 끝난 numba 커널. warm_jit_kernels()가 채우기 전(또는 numba 없음)엔 비어 있음
+_jit_kernels: dict[object, object] = {}
+
+
+def _jit(loop):
+    """loop의 numba 커널, 아직 준비 전이면 None → NumPy 경로. 여기서는 import/컴파일하지 않는다 (Tk 스레드 보호)."""
+    return _jit_kernels.get(loop)
+
+
+def _macd_tail_loop(close: np.ndarray, short: int, long: int, signal: int) -> tuple[float, float, float]:
+    """MACD / Signal / Histogram 마지막 값만 한 번의 스칼라 루프로 (numba 컴파일용)."""
+    ks = 2.0 / (short + 1)
+    kl = 2.0 / (long + 1)
+    kg = 2.0 / (signal + 1)
+    es = close[0]
+    el = close[0]
+    sig = 0.0
+    macd = 0.0
+    for i in range(1, close.size):
+        v = close[i]
+        es = ks * v + (1.0 - ks) * es
+        el = kl * v + (1.0 - kl) * el
+        macd = es - el
+        sig = kg * macd + (1.0 - kg) * sig
+    return macd, sig, macd - sig
+
+
+def calc_macd_last(
+    closes,
+    short: int = 12,
+    long: int = 26,
+    signal: int = 9,
+) -> tuple[float, float, float] | None:
+    """MACD / Signal / Histogram 마지막 값. 시계열 배열을 만들지 않는다."""
+    a = _as_float_array(closes)
+    if a.size == 0:
         return None
 
-    gains: list[float] = []
-    losses: list[float] = []
+    kernel = _jit(_macd_tail_loop)
+    if kernel is not None:
+        macd, sig, hist = kernel(np.ascontiguousarray(a), short, long, signal)
+        return float(macd), float(sig), float(hist)
+
+    macd_line, signal_line, hist = calc_macd_series(a, short, long, signal)
+    return float(macd_line[-1]), float(signal_line[-1]), float(hist[-1])
+
+
+def _rsi_wilder_loop(close: np.ndarray, n: int) -> np.ndarray:
+    """Wilder RSI 스칼라 루프 (numba 컴파일용). calc_rsi_series와 같은 결과."""
+    out = np.empty(close.size - n, dtype=close.dtype)
+    avg_gain = 0.0
+    avg_loss = 0.0
+    # 상승/하락 분리는 비교 분기 없이 (d + |d|) / 2, (|d| - d) / 2 (둘 다 정확한 값)
+    for i in range(1, n + 1):
+        diff = close[i] - close[i - 1]
+        adiff = abs(diff)
+        avg_gain += (diff + adiff) * 0.5
+        avg_loss += (adiff - diff) * 0.5
+    avg_gain /= n
+    avg_loss /= n
+    out[0] = 100.0 if avg_loss == 0 else 100.0 * avg_gain / (avg_gain + avg_loss)
+
+    for i in range(n + 1, close.size):
+        diff = close[i] - close[i - 1]
+        adiff = abs(diff)
+        gain = (diff + adiff) * 0.5
+        loss = (adiff - diff) * 0.5
+        avg_gain = (avg_gain * (n - 1) + gain) / n
+        avg_loss = (avg_loss * (n - 1) + loss) / n
+        out[i - n] = 100.0 if avg_loss == 0 else 100.0 * avg_gain / (avg_gain + avg_loss)
+    return out
+
+
+def calc_rsi_series(closes: FloatSeries, period: int = 14) -> np.ndarray:
+    """RSI 시계열 (Wilder 방식). closes[period:] 각 시점의 RSI, 길이 len(closes) - period."""
+    a = _as_float_array(closes)
+    if a.size < period + 1:
+        return np.empty(0, dtype=a.dtype)
+
+    # numba가 있으면 한 번 컴파일(디스크 캐시)해서 C 속도로, 없으면 아래 NumPy 경로
+    kernel = _jit(_rsi_wilder_loop)
+    if kernel is not None:
+        return kernel(np.ascontiguousarray(a), period)
+
+    diff = np.diff(a)
+    adiff = np.abs(diff)
+    gains = (diff + adiff) * 0.5
+    losses = (adiff - diff) * 0.5
+
+    avg_gain = _wilder_rma(gains, period)
+    avg_loss = _wilder_rma(losses, period)
+
+    # avg_loss == 0 이면 100, 아니면 100 - 100 / (1 + rs) == 100 * g / (g + l)
+    total = avg_gain + avg_loss
+    rsi = np.full(avg_gain.size, 100.0, dtype=a.dtype)
+    np.divide(100.0 * avg_gain, total, out=rsi, where=avg_loss != 0)
+    return rsi
+
+
+def _wilder_avg_loop(close: np.ndarray, n: int) -> tuple[float, float]:
+    """Wilder avg_gain / avg_loss 의 마지막 값만 (numba 컴파일용). 시계열 배열을 만들지 않는다."""
+    avg_gain = 0.0
+    avg_loss = 0.0
+    for i in range(1, n + 1):
+        diff = close[i] - close[i - 1]
+        adiff = abs(diff)
+        avg_gain += (diff + adiff) * 0.5
+        avg_loss += (adiff - diff) * 0.5
+    avg_gain /= n
+    avg_loss /= n
+
+    for i in range(n + 1, close.size):
+        diff = close[i] - close[i - 1]
+        adiff = abs(diff)
+        avg_gain = (avg_gain * (n - 1) + (diff + adiff) * 0.5) / n
+        avg_loss = (avg_loss * (n - 1) + (adiff - diff) * 0.5) / n
+    return avg_gain, avg_loss
+
+
+def _wilder_avgs(closes: FloatSeries, n: int) -> tuple[float, float]:
+    """closes 끝 시점의 Wilder (avg_gain, avg_loss). len(closes) >= n + 1 이어야 한다."""
+    a = _as_float_array(closes)
+    kernel = _jit(_wilder_avg_loop)
+    if kernel is not None:
+        avg_gain, avg_loss = kernel(np.ascontiguousarray(a), n)
+        return float(avg_gain), float(avg_loss)
+
+    diff = np.diff(a)
+    adiff = np.abs(diff)
+    return (
+        float(_wilder_rma((diff + adiff) * 0.5, n)[-1]),
+        float(_wilder_rma((adiff - diff) * 0.5, n)[-1]),
+    )
 
-    for i in range(1, len(closes)):
-        diff = closes[i] - closes[i - 1]
-        if diff >= 0:
-            gains.append(diff)
-            losses.append(0.0)
-        else:
-            gains.append(0.0)
-            losses.append(-diff)
 
-    avg_gain = sum(gains[:period]) / period
-    avg_loss = sum(losses[:period]) / period
+def warm_jit_kernels() -> None:
+    """
+    numba import + 지표 커널 컴파일(디스크 캐시 로드)을 한 번에. 백그라운드 워커에서 호출한다.
+    - 수백 ms~1초 걸리므로 Tk 스레드가 첫 틱에서 멈추지 않도록 여기서만
+    - 캐시 배열(PRICE_DTYPE)과 list 입력(float64) 두 시그니처를 더미 배열로 미리 컴파일
+    - 컴파일이 끝난 커널만 _jit_kernels에 등록 (그 전까지 호출하는 쪽은 NumPy 경로)
+    """
+    if _jit_kernels:
+        return
+    try:
+        from numba import njit
+    except ImportError:
+        return
+
+    loops = (
+        (_rsi_wilder_loop, (14,)),
+        (_wilder_avg_loop, (14,)),
+        (_macd_tail_loop, (12, 26, 9)),
+    )
+    for loop, args in loops:
+        kernel = njit(cache=True, fastmath=True)(loop)
+        for dtype in (PRICE_DTYPE, np.float64):
+            kernel(np.linspace(1.0, 2.0, 64, dtype=dtype), *args)
+        _jit_kernels[loop] = kernel
 
-    for i in range(period, len(gains)):
-        avg_gain = (avg_gain * (period - 1) + gains[i]) / period
-        avg_loss = (avg_loss * (period - 1) + losses[i]) / period
 
+def calc_rsi(closes: FloatSeries, period: int = 14) -> float | None:
+    """단순 RSI 계산 (Wilder 방식 근사). 마지막 값만 필요하므로 시계열은 만들지 않는다."""
+    if len(closes) < period + 1:
+        return None
+    avg_gain, avg_loss = _wilder_avgs(closes, period)
     if avg_loss == 0:
         return 100.0
-
-    rs = avg_gain / avg_loss
-    rsi = 100 - (100 / (1 + rs))
-    return float(rsi)
+    return 100.0 * avg_gain / (avg_gain + avg_loss)
 
 
 class IndicatorEngine:
@@ -309,36 +856,30 @@ class IndicatorEngine:
 
     def __init__(self, data_engine: "DataEngine") -> None:
         self._data_engine = data_engine
-
-    # ---------- 안전 float 변환 ----------
-    def _to_float(self, val):
-        """
-        float 변환을 시도하고, 실패하면 None을 반환한다.
-        Upbit API의 None, '', '0E-8' 같은 값도 안전하게 처리.
-        """
-        if val is None:
-            return None
-        try:
-            return float(val)
-        except (TypeError, ValueError):
-            return None
-
-    def _get_closes(self, market: str, tf: str) -> list[float] | None:
+        # ↙ (market, tf) → (last_refresh, closes). 같은 refresh 안에서는
+        #    rsi/macd/trend_score가 같은 배열을 공유한다.
+        self._closes_cache: dict[tuple[str, str], tuple[object, np.ndarray | None]] = {}
+        # ↙ (market, tf) → (gen, period, avg_gain, avg_loss, last_close, last_candle_ts)
+        #    마지막 "확정" 캔들(진행 중 캔들 바로 앞)까지 접은 Wilder 상태
+        self._rsi_state: dict[tuple[str, str], tuple[object, int, float, float, float, object]] = {}
+
+    def _get_closes(self, market: str, tf: str) -> np.ndarray | None:
         data = self._data_engine.get(market, tf)
-        if not data or "candles" not in data:
+        if not data or "arr" not in data:
             return None
 
-        candles: list[dict] = data["candles"]  # type: ignore[assignment]
-        closes: list[float] = []
-
-        for c in candles:
-            v = self._to_float(c.get("trade_price"))
-            if v is None:
-                # 깨진 값(None, '', 이상한 문자열)은 스킵
-                continue
-            closes.append(v)
+        key = (market, tf)
+        stamp = data.get("last_refresh")
+        cached = self._closes_cache.get(key)
+        if cached is not None and stamp is not None and cached[0] == stamp:
+            return cached[1]
 
-        return closes or None
+        closes: np.ndarray = data["arr"]["c"]
+        # 깨진 값(None, '', 이상한 문자열 → NaN)은 스킵
+        closes = closes[np.isfinite(closes)]
+        result = closes if closes.size else None
+        self._closes_cache[key] = (stamp, result)
+        return result
 
     def rsi(self, market: str, tf: str, period: int = 14) -> float | None:
         closes = self._get_closes(market, tf)
@@ -346,6 +887,74 @@ class IndicatorEngine:
             return None
         return calc_rsi(closes, period=period)
 
+    def rsi_incremental(self, market: str, tf: str, period: int = 14) -> float | None:
+        """
+        rsi()와 같은 Wilder RSI를 매 틱 전체 재계산 없이 구한다.
+        - 확정 캔들까지의 avg_gain/avg_loss를 보관해 두고, 그 뒤로 새로 확정된 캔들만 접는다
+        - 배열은 끝에서부터 필요한 칸만 읽는다 (보통 1~2칸)
+        - 진행 중인 마지막 캔들은 보관 상태에 넣지 않고 한 스텝만 임시로 적용
+        - 상태가 없거나, 배열을 전체 다시 채웠거나(gen), 마지막 확정 캔들이 창 밖으로 밀려났으면
+          확정 캔들 전체로 다시 시드
+        """
+        data = self._data_engine.get(market, tf)
+        if not data or "arr" not in data:
+            return None
+
+        c = data["arr"]["c"]
+        t = data["arr"]["t"]
+
+        # 끝에서부터: 진행 중 캔들(cur)과 마지막 확정 캔들(last_closed) 위치 (깨진 값 = NaN은 건너뜀)
+        cur = len(c) - 1
+        while cur >= 0 and not math.isfinite(c[cur]):
+            cur -= 1
+        last_closed = cur - 1
+        while last_closed >= 0 and not math.isfinite(c[last_closed]):
+            last_closed -= 1
+        if last_closed < 0:
+            return self.rsi(market, tf, period)
+
+        n = period
+        key = (market, tf)
+        gen = data.get("gen")
+        state = self._rsi_state.get(key)
+
+        start = -1
+        if state is not None and state[0] == gen and state[1] == n:
+            ts = state[5]
+            for i in range(last_closed, -1, -1):
+                if t[i] == ts:
+                    start = i
+                    break
+
+        if state is None or start < 0:
+            # 시드: 확정 캔들 전체로 Wilder 평균 (rsi()와 같은 식)
+            closed = c[:last_closed + 1]
+            closed = closed[np.isfinite(closed)]
+            if closed.size < n + 1:
+                return self.rsi(market, tf, period)
+            avg_gain, avg_loss = _wilder_avgs(closed, n)
+        else:
+            _, _, avg_gain, avg_loss, prev, _ = state
+            for i in range(start + 1, last_closed + 1):
+                x = float(c[i])
+                if not math.isfinite(x):
+                    continue
+                diff = x - prev
+                avg_gain = (avg_gain * (n - 1) + max(diff, 0.0)) / n
+                avg_loss = (avg_loss * (n - 1) + max(-diff, 0.0)) / n
+                prev = x
+
+        prev = float(c[last_closed])
+        self._rsi_state[key] = (gen, n, avg_gain, avg_loss, prev, t[last_closed])
+
+        # 진행 중 캔들 한 스텝 (상태에는 반영하지 않음)
+        diff = float(c[cur]) - prev
+        avg_gain = (avg_gain * (n - 1) + max(diff, 0.0)) / n
+        avg_loss = (avg_loss * (n - 1) + max(-diff, 0.0)) / n
+        if avg_loss == 0:
+            return 100.0
+        return 100.0 * avg_gain / (avg_gain + avg_loss)
+
     def macd(
         self,
         market: str,
@@ -358,36 +967,19 @@ class IndicatorEngine:
         if closes is None:
             return None
 
-        def ema(vals: list[float], period: int) -> list[float]:
-            k = 2 / (period + 1)
-            ema_vals: list[float] = []
-            prev: float | None = None
-            for v in vals:
-                if prev is None:
-                    prev = v
-                else:
-                    prev = v * k + prev * (1 - k)
-                ema_vals.append(prev)
-            return ema_vals
-
-        ema_short = ema(closes, short)
-        ema_long = ema(closes, long)
-        macd_line = [s - lg for s, lg in zip(ema_short, ema_long)]
-        signal_line = ema(macd_line, signal)
-        hist = macd_line[-1] - signal_line[-1]
-        return macd_line[-1], signal_line[-1], hist
+        return calc_macd_last(closes, short, long, signal)
 
     def trend_score(self, market: str, tf: str) -> float | None:
         closes = self._get_closes(market, tf)
         if closes is None or len(closes) < 10:
             return None
 
-        xs = list(range(len(closes)))
-        ys = closes
-        x_mean = sum(xs) / len(xs)
-        y_mean = sum(ys) / len(ys)
-        num = sum((x - x_mean) * (y - y_mean) for x, y in zip(xs, ys))
-        den = sum((x - x_mean) ** 2 for x in xs) or 1.0
+        # x = 0..n-1 최소제곱 기울기: x_mean, den은 닫힌 식, num만 dot 한 번
+        n = closes.size
+        x_mean = (n - 1) / 2.0
+        xs = np.arange(n, dtype=closes.dtype) - x_mean
+        num = float(np.dot(xs, closes - closes.mean()))
+        den = n * (n * n - 1) / 12.0 or 1.0
         slope = num / den
 
         raw_score = 50 + slope * 1000
@@ -404,16 +996,31 @@ class ChartEngine:
     - Dashboard는 update()에 캔들/심볼/TF만 넘겨주면 됨
     """
 
-    def __init__(self) -> None:
+    def __init__(self, dpi: int = DEFAULT_CHART_DPI) -> None:
+        self.dpi = dpi
         self.fig: Figure | None = None
-        self.ax_price = None
-        self.ax_macd = None
-        self.ax_rsi = None
+        self.ax_price: Axes | None = None
+        self.ax_macd: Axes | None = None
+        self.ax_rsi: Axes | None = None
         self.canvas: FigureCanvasTkAgg | None = None
-        self._status_artist = None
 
         # ↙ 차트 안 상태 텍스트(한 줄)를 관리하는 핸들
-        self._status_artist = None
+        self._status_artist: Text | None = None
+
+        # ↙ 한 번 만들어 두고 set_data 등으로 값만 바꾸는 데이터 artist 핸들 (blit 대상)
+        self._wick_lc: LineCollection | None = None
+        self._body_lc: LineCollection | None = None
+        self._macd_line: Line2D | None = None
+        self._signal_line: Line2D | None = None
+        self._hist_bars: PolyCollection | None = None
+        self._macd_zero: Line2D | None = None
+        self._macd_legend: Legend | None = None
+        self._rsi_line: Line2D | None = None
+        self._rsi_guides: list = []
+
+        # ↙ blit용: 캐시된 배경 + 마지막 전체 그리기 기준
+        self._background: object | None = None
+        self._layout_key: tuple | None = None
 
     # ---------- 숫자 단위 축약 포맷 ----------
     def _shorten_number(self, value, pos=None):
@@ -428,26 +1035,22 @@ class ChartEngine:
         else:
             return f"{value:.0f}"
 
-    # ---------- 안전 float 변환 ----------
-    def _to_float(self, val):
-        """
-        float 변환을 시도하고, 실패하면 None을 반환한다.
-        Upbit API의 None, '', '0E-8' 같은 값도 안전하게 처리.
-        """
-        try:
-            if val is None:
-                return None
-            return float(val)
-        except (TypeError, ValueError):
-            return None
-
     # ---------- 초기화 / 부착 ----------
     def init_figure(self) -> None:
         if self.fig is not None:
             return
 
+        import matplotlib
+
+        # Figure import 전에 Tk + Agg 래스터 백엔드로 고정 (자동 탐색/다른 백엔드 경로 방지)
+        matplotlib.use("TkAgg")
+
+        import matplotlib.ticker as mticker
+        from matplotlib.collections import LineCollection, PolyCollection
+        from matplotlib.figure import Figure
+
         # Figure & 3분할 레이아웃 생성
-        fig = Figure(figsize=(6, 4), dpi=100)
+        fig = Figure(figsize=(6, 4), dpi=self.dpi)
         fig.patch.set_facecolor("#151515")  # 🔥 이 줄 추가 (figure 전체 배경
         gs = fig.add_gridspec(3, 1, height_ratios=[5, 2, 2], hspace=0.05)
 
@@ -469,6 +1072,72 @@ class ChartEngine:
             bottom=0.25,   # 너무 작으면 0.25까지 올려도 됨
         )
 
+        # 스타일/로케이터는 여기서 한 번만 (매 틱마다 clear + 재적용하지 않음)
+        self._style_axes()
+        self.ax_macd.yaxis.set_major_locator(mticker.MaxNLocator(5))
+
+        # ----- 가격(캔들): 심지/몸통 컬렉션 -----
+        self._wick_lc = LineCollection([], animated=True)
+        self._body_lc = LineCollection([], animated=True)
+        self.ax_price.add_collection(self._wick_lc, autolim=False)
+        self.ax_price.add_collection(self._body_lc, autolim=False)
+
+        # ----- MACD: 라인 2개 + 히스토그램 + 0 기준선 + 범례 -----
+        (self._macd_line,) = self.ax_macd.plot(
+            [], [],
+            linewidth=1.0,
+            color="#4DA6FF",   # 밝은 파랑
+            label="MACD",
+            animated=True,
+        )
+        (self._signal_line,) = self.ax_macd.plot(
+            [], [],
+            linewidth=1.0,
+            color="#FFD166",   # 연한 노랑
+            label="Signal",
+            animated=True,
+        )
+        self._hist_bars = PolyCollection([], alpha=0.8, edgecolors="none", animated=True)
+        self.ax_macd.add_collection(self._hist_bars, autolim=False)
+
+        # 0 기준선
+        self._macd_zero = self.ax_macd.axhline(0, linewidth=0.5, color="#777777", alpha=0.7)
+
+        # 작은 범례 (라인 위에 보이도록 같이 blit)
+        self._macd_legend = self.ax_macd.legend(loc="upper left", fontsize=7)
+        self._macd_legend.set_animated(True)
+
+        # ----- RSI: 라인 + 고정 기준선/존 음영 (값과 무관하므로 여기서 한 번만) -----
+        (self._rsi_line,) = self.ax_rsi.plot(
+            [], [],
+            linewidth=1.0,
+            color="#C792EA",   # 은은한 연보라
+            animated=True,
+        )
+        self._rsi_guides = [
+            # 기준선
+            self.ax_rsi.axhline(RSI_OVERSOLD, linestyle="--", linewidth=0.5),
+            self.ax_rsi.axhline(50, linestyle=":", linewidth=0.5, alpha=0.7),
+            self.ax_rsi.axhline(RSI_OVERBOUGHT, linestyle="--", linewidth=0.5),
+            # 🔥 RSI 존 음영: 과매도(0~RSI_OVERSOLD), 과매수(RSI_OVERBOUGHT~100)
+            self.ax_rsi.axhspan(0, RSI_OVERSOLD, color="#4DFF88", alpha=0.05),
+            self.ax_rsi.axhspan(RSI_OVERBOUGHT, 100, color="#FF6B6B", alpha=0.05),
+        ]
+        self.ax_rsi.set_ylim(0, 100)
+        # 🔹 y축 눈금 고정: 0 / 과매도 / 50 / 과매수 / 100
+        self.ax_rsi.set_yticks([0, RSI_OVERSOLD, 50, RSI_OVERBOUGHT, 100])
+
+        # ---------- 차트 안 하단 상태 텍스트 (가격 축 기준, 아래쪽 바깥 여백에 살짝) ----------
+        self._status_artist = self.ax_price.text(
+            0.01, -0.12,
+            "",
+            transform=self.ax_price.transAxes,
+            fontsize=7,
+            color="#BBBBBB",
+            alpha=0.8,
+            va="top",
+        )
+
     def attach(self, master: ttk.Frame) -> None:
         """Tk Frame에 Canvas를 부착."""
         if self.fig is None:
@@ -476,8 +1145,11 @@ class ChartEngine:
         if self.canvas is not None:
             return
 
+        from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+
         self.canvas = FigureCanvasTkAgg(self.fig, master=master)
         self.canvas.get_tk_widget().pack(fill="both", expand=True)
+        self.canvas.mpl_connect("draw_event", self._on_draw)
 
     # ---------- 스타일 ----------
     def _style_axes(self) -> None:
@@ -486,14 +1158,26 @@ class ChartEngine:
 
         # 공통 스타일
         for ax in (self.ax_price, self.ax_macd, self.ax_rsi):
-            ax.set_facecolor("#151515")
-            ax.grid(True, color="white", alpha=0.15, linewidth=0.5)
-            ax.tick_params(colors="white", labelsize=8)
+            self._style_common(ax)
 
         # 상단 두 축은 x축 라벨 숨김
         self.ax_price.tick_params(axis="x", which="both", labelbottom=False)
         self.ax_macd.tick_params(axis="x", which="both", labelbottom=False)
 
+        self._style_rsi_axis()
+
+        # 🔥 마지막에 y축을 모두 오른쪽으로 고정
+        self._fix_axes_y_right()
+
+    def _style_common(self, ax) -> None:
+        ax.set_facecolor("#151515")
+        ax.grid(True, color="white", alpha=0.15, linewidth=0.5)
+        ax.tick_params(colors="white", labelsize=8)
+
+    def _style_rsi_axis(self) -> None:
+        if self.ax_rsi is None:
+            return
+
         # RSI y축 라벨
         self.ax_rsi.set_ylabel("RSI", color="white", fontsize=8)
 
@@ -502,9 +1186,6 @@ class ChartEngine:
         for lbl in self.ax_rsi.get_xticklabels():
             lbl.set_visible(True)
 
-        # 🔥 마지막에 y축을 모두 오른쪽으로 고정
-        self._fix_axes_y_right()
-
     # ---------- Y축을 항상 오른쪽에 두는 설정 ----------
     def _fix_axes_y_right(self) -> None:
         # 가격 차트
@@ -525,14 +1206,16 @@ class ChartEngine:
     # ---------- 업데이트 ----------
     def update(
         self,
-        candles: list[dict],
+        candles: list[dict] | None,
         market: str,
         tf: str,
         last_refresh: datetime | None,
+        arrays: dict[str, np.ndarray] | None = None,
     ) -> str:
         """
-        캔들 리스트로부터 캔들+MACD+RSI를 모두 그린 뒤
-        상태 문자열을 반환한다.
+        캔들+MACD+RSI를 모두 그린 뒤 상태 문자열을 반환한다.
+        - arrays: DataEngine 캐시의 OHLC/시간 배열("arr"). 주어지면 이것만 읽는다 (dict 리스트는 안 봄)
+        - arrays가 없을 때만 candles(dict 리스트)에서 직접 만든다
         """
         if self.fig is None or self.ax_price is None:
             self.init_figure()
@@ -541,75 +1224,196 @@ class ChartEngine:
         if self.ax_price is None or self.ax_macd is None or self.ax_rsi is None:
             return "차트: 축 초기화 실패"
 
-        if not candles:
-            return "차트: 캔들 데이터 없음"
-
         # 최근 N개만 사용
         N = 120
-        candles_slice = candles[-N:]
-
-        xs = list(range(len(candles_slice)))
-        opens: list[float] = []
-        highs: list[float] = []
-        lows: list[float] = []
-        closes: list[float] = []
-
-        # 시간 라벨용
-        times: list[str] = []
-
-        for c in candles_slice:
-            o = self._to_float(c.get("opening_price"))
-            h = self._to_float(c.get("high_price"))
-            low = self._to_float(c.get("low_price"))
-            p = self._to_float(c.get("trade_price"))
-
-            # 하나라도 깨지면 그 캔들은 스킵
-            if o is None or h is None or low is None or p is None:
-                continue
-
-            opens.append(o)
-            highs.append(h)
-            lows.append(low)
-            closes.append(p)
-
-            # KST 기준 시간 문자열 (HH:MM)
-            t_raw = c.get("candle_date_time_kst") or c.get("candle_date_time_utc")
-            if isinstance(t_raw, str) and len(t_raw) >= 16:
-                times.append(t_raw[11:16])  # "YYYY-MM-DDTHH:MM:SS" -> "HH:MM"
-            else:
-                times.append("")
+        if arrays is None:
+            if not candles:
+                return "차트: 캔들 데이터 없음"
+            arrays = _build_candle_arrays(candles[-N:])
+
+        n_slice = min(N, arrays["c"].size)
+        if n_slice == 0:
+            return "차트: 캔들 데이터 없음"
+
+        opens = arrays["o"][-N:]
+        highs = arrays["h"][-N:]
+        lows = arrays["l"][-N:]
+        closes = arrays["c"][-N:]
+        t_raw = arrays["t"][-N:]
+
+        # 하나라도 깨지면 그 캔들은 스킵
+        valid = np.isfinite(opens) & np.isfinite(highs) & np.isfinite(lows) & np.isfinite(closes)
+        opens = opens[valid]
+        highs = highs[valid]
+        lows = lows[valid]
+        closes = closes[valid]
+
+        xs = list(range(n_slice))
+
+        # KST 기준 시간 문자열 (HH:MM) — 캐시에 미리 잘라 둔 라벨의 꼬리만 사용
+        times: np.ndarray = arrays["hm"][-N:][valid]
 
         # 🔹 유효한 캔들이 하나도 없으면 종료
-        if not closes:
+        if closes.size == 0:
             return "차트: 유효한 캔들 데이터 없음"
 
-        # Axes 초기화 및 스타일 재적용
-        self.ax_price.clear()
-        self.ax_macd.clear()
-        self.ax_rsi.clear()
-        self._style_axes()
-
         # ----- 가격(캔들) -----
         num_candles = len(closes)
 
+        # 심지/몸통을 캔들마다 vlines로 그리지 않고, 선분 배열로 묶어서 컬렉션 2개로 한 번에 추가
+        cx = np.arange(num_candles, dtype=closes.dtype)
+        colors = np.where(closes >= opens, "#4DFF88", "#FF4D4D")
+        wick_segments = np.stack([np.stack([cx, lows], 1), np.stack([cx, highs], 1)], 1)
+        body_segments = np.stack([np.stack([cx, opens], 1), np.stack([cx, closes], 1)], 1)
+
+        # ----- MACD -----
+        macd_line = np.empty(0)
+        signal_line = np.empty(0)
+        hist_vals = np.empty(0)
+        xs_macd: list[int] = []
+        macd_max_abs = 0.0
+
+        if len(closes) >= 35:
+            macd_raw, signal_raw, hist_raw = calc_macd_series(closes, 12, 26, 9)
+
+            min_len = min(len(macd_raw), len(xs))
+            macd_line = macd_raw[-min_len:]
+            signal_line = signal_raw[-min_len:]
+            hist_vals = hist_raw[-min_len:]
+            xs_macd = xs[-min_len:]
+            macd_max_abs = float(
+                max(np.abs(macd_line).max(), np.abs(signal_line).max(), np.abs(hist_vals).max())
+            )
+
+        # ---------- MACD 히스토그램 양/음 분리 (폭 0.6 막대 → 사각형 꼭짓점 배열) ----------
+        hx = np.asarray(xs_macd, dtype=np.float64)
+        zeros = np.zeros_like(hx)
+        hist_verts = np.stack(
+            [
+                np.stack([hx - 0.3, zeros], 1),
+                np.stack([hx - 0.3, hist_vals], 1),
+                np.stack([hx + 0.3, hist_vals], 1),
+                np.stack([hx + 0.3, zeros], 1),
+            ],
+            1,
+        )
+        hist_colors = np.where(hist_vals >= 0, "#4DA6FF", "#FF6B6B")
+
+        # ----- RSI -----
+        rsi_vals: list[float] = []
+        if len(closes) >= 15:
+            rsi_vals = calc_rsi_series(closes, period=14).tolist()
+
+        rsi_to_plot: list[float] = []
+        xs_rsi: list[int] = []
+        if rsi_vals:
+            min_len_rsi = min(len(rsi_vals), len(xs))
+            rsi_to_plot = rsi_vals[-min_len_rsi:]
+            xs_rsi = xs[-min_len_rsi:]
+
+        # 🔹 last_refresh 텍스트 만들기
+        if isinstance(last_refresh, datetime):
+            ts_text = last_refresh.strftime("%Y-%m-%d %H:%M:%S")
+        else:
+            ts_text = str(last_refresh)
+
+        # ---------- 차트 안 하단 상태 텍스트 ----------
+        status_text = f"{market} / TF {tf} | {n_slice} candles | last={ts_text}"
+
+        frame = {
+            "market": market,
+            "tf": tf,
+            "num_candles": num_candles,
+            "colors": colors,
+            "wick_segments": wick_segments,
+            "body_segments": body_segments,
+            "price_range": (float(lows.min()), float(highs.max())),
+            "times": times,
+            "xs_macd": xs_macd,
+            "macd_line": macd_line,
+            "signal_line": signal_line,
+            "hist_verts": hist_verts,
+            "hist_colors": hist_colors,
+            "macd_max_abs": macd_max_abs,
+            "x_count": len(xs),
+            "xs_rsi": xs_rsi,
+            "rsi_to_plot": rsi_to_plot,
+            "status_text": status_text,
+        }
+
+        # 같은 심볼/TF + 같은 캔들 구간(첫/끝 캔들 동일)이면 마지막 캔들 값만 바뀐 것
+        #   → 배경은 그대로 두고 데이터 artist만 다시 그린다 (blit)
+        layout_key = (market, tf, n_slice, num_candles, t_raw[0], t_raw[-1])
+        if layout_key != self._layout_key or not self._incremental_draw(frame):
+            self._full_draw(frame)
+            self._layout_key = layout_key
+
+        return f"차트 OK — {market} / TF {tf} / 캔들 {n_slice}개 / last_refresh={ts_text}"
+
+    # ---------- 데이터 artist 값 반영 ----------
+    def _set_artist_data(self, frame: dict) -> None:
+        """미리 만들어 둔 artist에 이번 프레임 값을 넣는다 (새 artist 생성 없음)."""
+        if (
+            self._wick_lc is None
+            or self._body_lc is None
+            or self._macd_line is None
+            or self._signal_line is None
+            or self._hist_bars is None
+            or self._rsi_line is None
+            or self._status_artist is None
+        ):
+            return
+
+        self._wick_lc.set_segments(frame["wick_segments"])
+        self._wick_lc.set_color(frame["colors"])
+        self._body_lc.set_segments(frame["body_segments"])
+        self._body_lc.set_color(frame["colors"])
+
+        self._macd_line.set_data(frame["xs_macd"], frame["macd_line"])
+        self._signal_line.set_data(frame["xs_macd"], frame["signal_line"])
+        self._hist_bars.set_verts(frame["hist_verts"])
+        self._hist_bars.set_facecolor(frame["hist_colors"])
+
+        self._rsi_line.set_data(frame["xs_rsi"], frame["rsi_to_plot"])
+
+        # 상태 텍스트는 배경(정적) 쪽이라 다음 전체 그리기 때 반영된다
+        self._status_artist.set_text(frame["status_text"])
+
+    # ---------- 전체 그리기 ----------
+    def _full_draw(self, frame: dict) -> None:
+        """축 범위/눈금까지 다시 잡고 전체를 그린다. 데이터 artist는 animated라 _on_draw에서 덧그린다."""
+        if self.ax_price is None or self.ax_macd is None or self.ax_rsi is None:
+            return
+        if (
+            self._wick_lc is None
+            or self._body_lc is None
+            or self._macd_zero is None
+            or self._macd_legend is None
+        ):
+            return
+
+        # 이전 배경은 무효 (다음 draw_event에서 다시 캡처)
+        self._background = None
+
+        # ----- 가격(캔들) -----
+        num_candles = frame["num_candles"]
+
         # 캔들 개수에 따라 몸통/심지 굵기 자동 조절
         body_width = min(6.0, max(1.0, 240 / max(1, num_candles)))
         wick_width = max(0.5, body_width * 0.35)
+        self._wick_lc.set_linewidth(wick_width)
+        self._body_lc.set_linewidth(body_width)
 
-        for i, (o, h, low, c) in enumerate(zip(opens, highs, lows, closes)):
-            color = "#4DFF88" if c >= o else "#FF4D4D"
-
-            # 심지
-            self.ax_price.vlines(i, low, h, color=color, linewidth=wick_width)
-            # 몸통
-            self.ax_price.vlines(i, o, c, color=color, linewidth=body_width)
+        self.ax_price.set_title(f"{frame['market']} / TF {frame['tf']}", color="white", fontsize=9)
 
-        # 루프 밖에서 한 번만
-        self.ax_price.set_title(f"{market} / TF {tf}", color="white", fontsize=9)
-        self.ax_price.margins(x=0.01, y=0.08)
+        # 컬렉션은 autoscale 대상이 아니므로 범위를 직접 잡는다 (margins x=0.01, y=0.08 과 동일)
+        low, high = frame["price_range"]
+        span = (high - low) or (abs(high) * 0.05 or 1.0)
+        self.ax_price.set_ylim(low - span * 0.08, high + span * 0.08)
 
         # ----- x축 라벨 (RSI 축에만) -----
-        if times:
+        times = frame["times"]
+        if times.size:
             step = max(1, len(times) // 8)
             tick_idx = list(range(0, len(times), step))
 
@@ -629,180 +1433,86 @@ class ChartEngine:
             self.ax_rsi.tick_params(axis="x", which="both", labelbottom=True, pad=10)
 
         # ----- MACD -----
-        def ema(vals: list[float], period: int) -> list[float]:
-            k = 2 / (period + 1)
-            ema_vals: list[float] = []
-            prev: float | None = None
-            for v in vals:
-                if prev is None:
-                    prev = v
-                else:
-                    prev = v * k + prev * (1 - k)
-                ema_vals.append(prev)
-            return ema_vals
-
-        macd_line = []
-        signal_line = []
-        hist_vals = []
-        xs_macd: list[int] = []
-
-        if len(closes) >= 35:
-            ema_short = ema(closes, 12)
-            ema_long = ema(closes, 26)
-            macd_raw = [s - lg for s, lg in zip(ema_short, ema_long)]
-            signal_raw = ema(macd_raw, 9)
-
-            min_len = min(len(macd_raw), len(signal_raw), len(xs))
-            macd_line = macd_raw[-min_len:]
-            signal_line = signal_raw[-min_len:]
-            hist_vals = [m - s for m, s in zip(macd_line, signal_line)]
-            xs_macd = xs[-min_len:]
+        has_macd = bool(frame["xs_macd"])
+        self._macd_zero.set_visible(has_macd)
+        self._macd_legend.set_visible(has_macd)
 
-            # MACD 라인
-            self.ax_macd.plot(
-                xs_macd,
-                macd_line,
-                linewidth=1.0,
-                color="#4DA6FF",   # 밝은 파랑
-                label="MACD",
-            )
-
-            # Signal 라인
-            self.ax_macd.plot(
-                xs_macd,
-                signal_line,
-                linewidth=1.0,
-                color="#FFD166",   # 연한 노랑
-                label="Signal",
-            )
-
-            # ---------- MACD 히스토그램 양/음 분리 ----------
-            colors = [
-                "#4DA6FF" if h >= 0 else "#FF6B6B"
-                for h in hist_vals
-            ]
-
-            self.ax_macd.bar(
-                xs_macd,
-                hist_vals,
-                width=0.6,
-                color=colors,
-                alpha=0.8,
-            )
-
-            # 🔹 MACD 축: 0을 기준으로 위·아래 대칭 범위 잡기
-            all_macd_vals = macd_line + signal_line + hist_vals
-            if all_macd_vals:
-                max_abs = max(abs(v) for v in all_macd_vals) or 1.0
-                self.ax_macd.set_ylim(-max_abs * 1.1, max_abs * 1.1)
-
-            # 0 기준선
-            self.ax_macd.axhline(0, linewidth=0.5, color="#777777", alpha=0.7)
-
-            # y축 눈금 개수 5개 정도로 정리
-            self.ax_macd.yaxis.set_major_locator(mticker.MaxNLocator(5))
-
-            # 작은 범례
-            self.ax_macd.legend(loc="upper left", fontsize=7)
-
-
-        # ----- RSI -----
-        rsi_vals: list[float] = []
-        if len(closes) >= 15:
-            gains: list[float] = []
-            losses: list[float] = []
-            for i in range(1, len(closes)):
-                diff = closes[i] - closes[i - 1]
-                if diff >= 0:
-                    gains.append(diff)
-                    losses.append(0.0)
-                else:
-                    gains.append(0.0)
-                    losses.append(-diff)
-
-            period = 14
-            if len(gains) >= period:
-                avg_gain = sum(gains[:period]) / period
-                avg_loss = sum(losses[:period]) / period
-                rsis: list[float] = []
-                if avg_loss == 0:
-                    rsis.append(100.0)
-                else:
-                    rs = avg_gain / avg_loss
-                    rsis.append(100 - (100 / (1 + rs)))
-
-                for i in range(period, len(gains)):
-                    avg_gain = (avg_gain * (period - 1) + gains[i]) / period
-                    avg_loss = (avg_loss * (period - 1) + losses[i]) / period
-                    if avg_loss == 0:
-                        rsis.append(100.0)
-                    else:
-                        rs = avg_gain / avg_loss
-                        rsis.append(100 - (100 / (1 + rs)))
+        # 🔹 MACD 축: 0을 기준으로 위·아래 대칭 범위 잡기
+        max_abs = frame["macd_max_abs"] or 1.0
+        self.ax_macd.set_ylim(-max_abs * 1.1, max_abs * 1.1)
 
-                rsi_vals = rsis
-
-        if rsi_vals:
-            min_len_rsi = min(len(rsi_vals), len(xs))
-            rsi_to_plot = rsi_vals[-min_len_rsi:]
-            xs_rsi = xs[-min_len_rsi:]
-
-            # RSI 라인
-            self.ax_rsi.plot(
-                xs_rsi,
-                rsi_to_plot,
-                linewidth=1.0,
-                color="#C792EA",   # 은은한 연보라
-            )
-            # 기준선
-            self.ax_rsi.axhline(30, linestyle="--", linewidth=0.5)
-            self.ax_rsi.axhline(50, linestyle=":", linewidth=0.5, alpha=0.7)
-            self.ax_rsi.axhline(70, linestyle="--", linewidth=0.5)
-            self.ax_rsi.set_ylim(0, 100)
-
-            # 🔥 RSI 존 음영: 과매도(0~30), 과매수(70~100)
-            self.ax_rsi.axhspan(0, 30, color="#4DFF88", alpha=0.05)
-            self.ax_rsi.axhspan(70, 100, color="#FF6B6B", alpha=0.05)
-
-            # 🔹 y축 눈금 고정: 0 / 30 / 50 / 70 / 100
-            self.ax_rsi.set_yticks([0, 30, 50, 70, 100])
+        # ----- RSI: 기준선/음영은 init_figure에서 만든 것, 데이터 있을 때만 표시 -----
+        has_rsi = bool(frame["xs_rsi"])
+        for guide in self._rsi_guides:
+            guide.set_visible(has_rsi)
 
         # 🔎 디버그용으로 한 번은 라벨이 살아있는지 확인하고 싶으면:
         # self.ax_rsi.set_xlabel("TIME", color="yellow")
 
-        # 🔹 last_refresh 텍스트 만들기
-        if isinstance(last_refresh, datetime):
-            ts_text = last_refresh.strftime("%Y-%m-%d %H:%M:%S")
-        else:
-            ts_text = str(last_refresh)
+        # 공유 x축 범위 (히스토그램 막대 폭 ±0.3 + 기본 여백 5%)
+        x_lo, x_hi = -0.3, frame["x_count"] - 1 + 0.3
+        x_pad = (x_hi - x_lo) * 0.05
+        self.ax_price.set_xlim(x_lo - x_pad, x_hi + x_pad)
 
-        # ---------- 차트 안 하단 상태 텍스트 표시 ----------
-        status_text = f"{market} / TF {tf} | {len(candles_slice)} candles | last={ts_text}"
+        self._set_artist_data(frame)
 
-        if self.ax_price is not None:
-            # 이전에 그려진 텍스트가 있으면 지우기
-            if self._status_artist is not None:
-                try:
-                    self._status_artist.remove()
-                except Exception:
-                    pass
-
-            # 새 텍스트 추가 (가격 축 기준, 아래쪽 바깥 여백에 살짝)
-            self._status_artist = self.ax_price.text(
-                0.01, -0.12,
-                status_text,
-                transform=self.ax_price.transAxes,
-                fontsize=7,
-                color="#BBBBBB",
-                alpha=0.8,
-                va="top",
-            )
-
-        # 실제 그리기
+        # 실제 그리기 (animated artist는 _on_draw에서 배경 캡처 후 덧그림)
         if self.canvas is not None:
             self.canvas.draw_idle()
 
-        return f"차트 OK — {market} / TF {tf} / 캔들 {len(candles_slice)}개 / last_refresh={ts_text}"
+    # ---------- 부분 그리기 (blit) ----------
+    def _incremental_draw(self, frame: dict) -> bool:
+        """
+        캐시된 배경 위에 데이터 artist만 다시 그린다.
+        배경이 없거나 값이 현재 y축 범위를 벗어나면 False (→ 전체 그리기).
+        """
+        if self.canvas is None or self.fig is None or self._background is None:
+            return False
+        if self.ax_price is None or self.ax_macd is None:
+            return False
+
+        low, high = frame["price_range"]
+        y_min, y_max = self.ax_price.get_ylim()
+        if low < y_min or high > y_max:
+            return False
+
+        if frame["xs_macd"] and frame["macd_max_abs"] > self.ax_macd.get_ylim()[1]:
+            return False
+
+        self._set_artist_data(frame)
+
+        # 배경 복원 → 데이터 artist만 덧그리기 → 화면 반영
+        self.canvas.restore_region(self._background)
+        self._draw_animated()
+        self.canvas.blit(self.fig.bbox)
+        return True
+
+    def _animated_artists(self) -> list:
+        if self._wick_lc is None:
+            return []
+        return [
+            self._wick_lc,
+            self._body_lc,
+            self._hist_bars,
+            self._macd_line,
+            self._signal_line,
+            self._macd_legend,
+            self._rsi_line,
+        ]
+
+    def _draw_animated(self) -> None:
+        if self.fig is None:
+            return
+        # 일반 draw와 같은 겹침 순서가 되도록 zorder 순으로
+        for artist in sorted(self._animated_artists(), key=lambda a: a.get_zorder()):
+            self.fig.draw_artist(artist)
+
+    def _on_draw(self, event) -> None:
+        """전체 draw(리사이즈 포함)가 끝날 때마다 배경을 다시 캡처하고 데이터 artist를 덧그린다."""
+        if self.canvas is None or self.fig is None:
+            return
+        self._background = self.canvas.copy_from_bbox(self.fig.bbox)
+        self._draw_animated()
 
 
 # =========================================================
@@ -840,6 +1550,8 @@ class SeohyunDashboard(tk.Tk):
         self.snapshot_manager = SnapshotManager()
         self.data_engine = DataEngine(self.cfg)
         self.indicator_engine = IndicatorEngine(self.data_engine)
+        # refresh_all(HTTP 대기)은 Tk 스레드를 막지 않도록 전용 스레드 하나에서 실행
+        self._data_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="data-refresh")
 
         # Tk 변수들
         self.var_symbol = tk.StringVar(value=self.ctx.market)
@@ -867,12 +1579,33 @@ class SeohyunDashboard(tk.Tk):
         self.var_score_macd = tk.StringVar(value="-")
         self.var_score_trend = tk.StringVar(value="-")
 
-        # 🔹 실시간 데이터 상태 텍스트 (UI 왼쪽 '실시간 상태' 박스에서 사용)
-        self.var_data_status = tk.StringVar(value="데이터 상태: -")
-
         # ChartEngine
-        self.chart_engine = ChartEngine()
-        self._last_chart_redraw_ts: float | None = None
+        self.chart_engine = ChartEngine(dpi=self.cfg.chart_dpi)
+        # ↙ 마지막 차트 다시 그리기 시각 (time.time). 처음엔 -inf → 첫 그리기는 스로틀에 안 걸림
+        self._last_chart_redraw_ts = float("-inf")
+        # ↙ 차트에 마지막으로 그린 (market, tf, last_refresh)
+        self._last_chart_key: tuple | None = None
+
+        # ↙ (market, tf) → (last_refresh, valid_prices, total). 데이터가 안 바뀐 틱은 재검사 생략
+        self._valid_count_cache: dict[tuple[str, str], tuple[object, int, int]] = {}
+        # ↙ 상태 문구의 last_refresh "HH:MM:SS" (같은 datetime 객체면 다시 포맷하지 않음)
+        self._last_ts_obj: datetime | None = None
+        self._last_ts_str = "-"
+        # ↙ UI 틱이 마지막으로 다 반영한 (market, tf, last_refresh). 같으면 틱을 건너뛴다
+        self._last_seen_key: tuple | None = None
+        # ↙ 예약된 다음 UI 틱의 after id (<<CandleTick>>이 오면 취소 후 바로 실행)
+        self._ui_after_id: str | None = None
+        # ↙ 데이터 상태 라벨을 마지막으로 만든 입력 (state, market, tf, valid, total, detail)
+        self._last_status_key: tuple | None = None
+
+        # ↙ _set_var가 마지막으로 넣은 값 (Tcl 변수 이름 → 값)
+        self._var_shadow: dict[str, object] = {}
+
+        # 왼쪽 패널에서 만들어짐 (그 전에 틱이 돌아도 안전하도록 미리 None)
+        self.rsi_bar: ttk.Progressbar | None = None
+        # ↙ rsi_bar에 마지막으로 넣은 값/스타일 (같으면 Tcl 호출 생략)
+        self._last_rsi_value: float | None = None
+        self._last_rsi_style: str | None = None
 
         # UI 구성
         self._build_menu()
@@ -886,6 +1619,15 @@ class SeohyunDashboard(tk.Tk):
         self._start_data_refresh_loop()
         self._start_ui_refresh_loop()
 
+        # 지표 JIT 커널은 첫 데이터 갱신 뒤, 같은 워커에서 미리 컴파일 (Tk 스레드는 기다리지 않음)
+        self._data_pool.submit(warm_jit_kernels)
+
+    def destroy(self) -> None:
+        """창 닫기(WM_DELETE_WINDOW)/메뉴 종료 공통: 백그라운드 풀 정리 후 Tk 종료."""
+        # 대기 중인 갱신/워밍업은 취소, 진행 중인 것도 기다리지 않는다
+        self._data_pool.shutdown(wait=False, cancel_futures=True)
+        self.data_engine.close()
+        super().destroy()
 
     # ---------- 메뉴 ----------
     def _build_menu(self) -> None:
@@ -1059,25 +1801,34 @@ class SeohyunDashboard(tk.Tk):
         self.tabs.add(self.tab_gauge, text="게이지")
         self._build_tab_gauge(self.tab_gauge)
 
-        # 스코어
+        # 스코어 / 신호 / 리스크 / 로그: 정적 내용뿐이라 처음 선택될 때 만든다
         self.tab_score = ttk.Frame(self.tabs)
         self.tabs.add(self.tab_score, text="스코어")
-        self._build_tab_score(self.tab_score)
 
-        # 신호
         self.tab_signal = ttk.Frame(self.tabs)
         self.tabs.add(self.tab_signal, text="신호")
-        self._build_tab_signal(self.tab_signal)
 
-        # 리스크
         self.tab_risk = ttk.Frame(self.tabs)
         self.tabs.add(self.tab_risk, text="리스크")
-        self._build_tab_risk(self.tab_risk)
 
-        # 로그
         self.tab_log = ttk.Frame(self.tabs)
         self.tabs.add(self.tab_log, text="로그")
-        self._build_tab_log(self.tab_log)
+
+        # ↙ 탭 위젯 이름 → 아직 안 만든 탭의 빌더
+        self._tab_builders = {
+            str(self.tab_score): self._build_tab_score,
+            str(self.tab_signal): self._build_tab_signal,
+            str(self.tab_risk): self._build_tab_risk,
+            str(self.tab_log): self._build_tab_log,
+        }
+        self.tabs.bind("<<NotebookTabChanged>>", self._maybe_build_tab)
+
+    def _maybe_build_tab(self, event=None) -> None:
+        """선택된 탭이 아직 비어 있으면 그때 한 번만 내용을 만든다."""
+        selected = self.tabs.select()
+        builder = self._tab_builders.pop(selected, None)
+        if builder is not None:
+            builder(self.nametowidget(selected))
 
     # ---- 차트 탭 ----
     def _build_tab_chart(self, frame: ttk.Frame) -> None:
@@ -1248,9 +1999,21 @@ class SeohyunDashboard(tk.Tk):
 
     # ---------- 헬스체크 ----------
     def _run_initial_healthcheck(self) -> None:
-        """앱 시작 시 한 번만 헬스체크를 돌리고 라벨에 표시."""
+        """앱 시작 시 한 번만 헬스체크를 백그라운드로 돌리고, 끝나면 라벨에 표시."""
+        # 데이터 풀과 따로(1회용 워커): 디스크/네트워크 점검이 첫 캔들 요청을 막지 않도록
+        pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="healthcheck")
+        future = pool.submit(self.health_checker.run_all)
+        pool.shutdown(wait=False)  # 제출한 점검만 끝내고 워커 정리
+        self.after(DATA_POLL_MS, self._on_healthcheck_done, future)
+
+    def _on_healthcheck_done(self, future: Future) -> None:
+        # 데이터 루프와 같은 방식: 완료 여부는 Tk 스레드에서 after로 확인
+        if not future.done():
+            self.after(DATA_POLL_MS, self._on_healthcheck_done, future)
+            return
+
         try:
-            summary = self.health_checker.run_all()
+            summary = future.result()
         except Exception as e:
             logging.error("초기 헬스체크 실패: %s", e)
             summary = "[ERROR] 헬스체크 중 예외 발생"
@@ -1260,275 +2023,245 @@ class SeohyunDashboard(tk.Tk):
     # =====================================================
     # [SEC:UI_LOOP] 주기적 UI / 차트 리프레시 루프
     # =====================================================
+    def _set_var(self, var: tk.Variable, value) -> None:
+        """값이 바뀐 경우에만 Tk 변수에 set (같은 값이면 Tcl trace / 위젯 다시 그리기 생략)."""
+        key = str(var)  # Tcl 변수 이름 (인스턴스마다 고유)
+        if key in self._var_shadow and self._var_shadow[key] == value:
+            return
+        self._var_shadow[key] = value
+        var.set(value)
+
+    def _set_rsi_bar(self, value: float, style_name: str, min_delta: float = RSI_BAR_MIN_DELTA) -> None:
+        """rsi_bar 값/스타일을 바뀐 것만 반영 (값은 min_delta 이상 움직였을 때)."""
+        if self.rsi_bar is None:
+            return
+        last = self._last_rsi_value
+        if last is None or (value != last and abs(value - last) >= min_delta):
+            self.rsi_bar["value"] = value
+            self._last_rsi_value = value
+        if style_name != self._last_rsi_style:
+            self.rsi_bar.configure(style=style_name)
+            self._last_rsi_style = style_name
+
     def _start_ui_refresh_loop(self) -> None:
         """
         v2: DataEngine / IndicatorEngine / ChartEngine를
         주기적으로 동기화하는 메인 루프.
         """
-        REFRESH_MS = 1000  # 1초 간격 (원하면 나중에 설정값으로 뺄 수 있음)
+        self.bind("<<CandleTick>>", self._on_candle_tick)
 
-        def _tick() -> None:
-            try:
-                market = self.var_symbol.get()
-                tf = self.var_tf.get()
-
-                # -------------------------------------------------
-                # 1) DataEngine 캐시 갱신 + 상태 문자열 (NO DATA 3분리)
-                #   - CACHE MISS: 캐시에 엔트리 자체가 없음
-                #   - HTTP FAIL : fetch_ok=False 이면서 fetch_error 존재
-                #   - BAD VALUES: candles는 있는데 trade_price 유효값이 0개
-                # -------------------------------------------------
-                data = None
-                candles: list[dict] = []
-                last_refresh = None
-
-                fetch_ok = None
-                fetch_error = None
-
-                try:
-                    if hasattr(self, "data_engine"):
-                        data = self.data_engine.get(market, tf)
-                    else:
-                        data = None
-                except Exception as exc:
-                    data = None
-                    fetch_ok = False
-                    fetch_error = f"{type(exc).__name__}: {exc}"
-
-                # 캐시 파싱
-                if isinstance(data, dict):
-                    raw_candles = data.get("candles")
-                    if isinstance(raw_candles, list):
-                        candles = raw_candles
-                    last_refresh = data.get("last_refresh")
-                    fetch_ok = data.get("fetch_ok")
-                    fetch_error = data.get("fetch_error")
-
-                # 상태 문구 계산 (3분리 + OK)
-                if data is None:
-                    # ✅ 엔트리 자체가 없음
-                    data_status_text = f"CACHE MISS — {market} / TF {tf}"
+        # 최초 1회 즉시 실행
+        self._ui_tick()
+
+    def _on_candle_tick(self, event=None) -> None:
+        # 새 데이터가 들어오면 1초를 기다리지 않고 바로 반영 (예약된 틱은 취소 후 다시 예약)
+        if self._ui_after_id is not None:
+            self.after_cancel(self._ui_after_id)
+            self._ui_after_id = None
+        self._ui_tick()
+
+    def _ui_tick(self) -> None:
+        """한 틱: 데이터 상태 → RSI → 차트 반영 후 다음 틱 예약."""
+        try:
+            market = self.var_symbol.get()
+            tf = self.var_tf.get()
+
+            # -------------------------------------------------
+            # 1) DataEngine 캐시 갱신 + 상태 문자열 (NO DATA 3분리)
+            #   - CACHE MISS: 캐시에 엔트리 자체가 없음
+            #   - HTTP FAIL : fetch_ok=False 이면서 fetch_error 존재
+            #   - BAD VALUES: candles는 있는데 trade_price 유효값이 0개
+            # -------------------------------------------------
+            data = self.data_engine.get(market, tf)
+            candles: list[dict] = []
+            last_refresh = None
+
+            fetch_ok = None
+            fetch_error = None
+
+            # 캐시 파싱
+            if isinstance(data, dict):
+                raw_candles = data.get("candles")
+                if isinstance(raw_candles, list):
+                    candles = raw_candles
+                last_refresh = data.get("last_refresh")
+                fetch_ok = data.get("fetch_ok")
+                fetch_error = data.get("fetch_error")
+
+            # 이미 반영한 데이터면 상태/RSI/차트 모두 그대로 → 이번 틱은 예약만 (finally)
+            seen_key = (market, tf, last_refresh)
+            if data is not None and seen_key == self._last_seen_key:
+                return
+
+            # 상태 판정 (3분리 + OK) — 문구는 입력이 바뀐 경우에만 만든다
+            valid_prices = 0
+            detail = ""
+            if data is None:
+                # ✅ 엔트리 자체가 없음
+                state = "CACHE_MISS"
+            elif fetch_ok is False and fetch_error:
+                # ✅ HTTP/네트워크/429 등 실패가 기록된 케이스
+                state = "HTTP_FAIL"
+                detail = fetch_error
+            elif not candles:
+                # ✅ 요청은 됐는데 비어있음(또는 fallback 결과 비어있음)
+                state = "EMPTY"
+            else:
+                # ✅ 값 깨짐 검출 (같은 last_refresh면 지난 결과 재사용)
+                cached = self._valid_count_cache.get((market, tf))
+                if cached is not None and cached[0] == last_refresh and cached[2] == len(candles):
+                    valid_prices = cached[1]
                 else:
-                    if fetch_ok is False and fetch_error:
-                        # ✅ HTTP/네트워크/429 등 실패가 기록된 케이스
-                        data_status_text = f"HTTP FAIL — {fetch_error}"
-                    elif not candles:
-                        # ✅ 요청은 됐는데 비어있음(또는 fallback 결과 비어있음)
-                        data_status_text = f"NO DATA — EMPTY ({market} / TF {tf})"
+                    # DataEngine이 파싱해 둔 종가 배열(깨진 값 = NaN)에서 한 번에 센다
+                    arr = data.get("arr") or _build_candle_arrays(
+                        [c for c in candles if isinstance(c, dict)]
+                    )
+                    valid_prices = int(np.count_nonzero(np.isfinite(arr["c"])))
+                    self._valid_count_cache[(market, tf)] = (last_refresh, valid_prices, len(candles))
+
+                if valid_prices == 0:
+                    state = "BAD_VALUES"
+                else:
+                    state = "OK"
+                    if last_refresh is self._last_ts_obj:
+                        detail = self._last_ts_str
+                    elif isinstance(last_refresh, datetime):
+                        # strftime(로케일 경로) 대신 필드로 직접, 같은 객체면 재사용
+                        detail = f"{last_refresh.hour:02d}:{last_refresh.minute:02d}:{last_refresh.second:02d}"
+                        self._last_ts_obj, self._last_ts_str = last_refresh, detail
                     else:
-                        # ✅ 값 깨짐 검출
-                        valid_prices = 0
-                        for c in candles:
-                            if not isinstance(c, dict):
-                                continue
-                            v = c.get("trade_price")
-                            if isinstance(v, (int, float, str)):
-                                try:
-                                    float(v)
-                                    valid_prices += 1
-                                except (ValueError, TypeError):
-                                    pass
-
-                        if valid_prices == 0:
-                            data_status_text = f"BAD VALUES — 유효 price 0 ({market} / TF {tf})"
-                        else:
-                            if isinstance(last_refresh, datetime):
-                                ts = last_refresh.strftime("%H:%M:%S")
-                            else:
-                                ts = "-"
-                            data_status_text = f"DATA OK — {valid_prices}/{len(candles)} candles / last {ts}"
-
-                # UI 라벨 반영
-                if hasattr(self, "var_data_status"):
-                    try:
-                        self.var_data_status.set(data_status_text)
-                    except Exception:
-                        pass
+                        detail = "-"
+            no_data = state != "OK"
+
+            # UI 라벨 반영 (입력이 그대로면 문자열 생성도 set도 생략)
+            status_key = (state, market, tf, valid_prices, len(candles), detail)
+            if status_key != self._last_status_key:
+                self._last_status_key = status_key
+                self._set_var(
+                    self.var_data_status,
+                    DATA_STATUS_FORMATS[state].format(
+                        market=market, tf=tf, valid=valid_prices, total=len(candles), detail=detail
+                    ),
+                )
+
+            # CACHE MISS / HTTP FAIL / EMPTY / BAD VALUES: 지표/차트는 계산할 게 없으니 여기서 끝
+            if no_data:
+                self._set_var(self.var_rsi_value, "---")
+                self._set_var(self.var_rsi_status, "데이터 부족")
+                # 게이지도 라벨과 맞춰 비움 (0 / 중립 스타일)
+                self._set_rsi_bar(0.0, RSI_ZONES[1][1], min_delta=0.0)
+                self._set_var(self.var_chart_status, "차트: 캔들 데이터 없음")
+                self._last_seen_key = seen_key
+                return
 
-                # -------------------------------------------------
-                # 2) IndicatorEngine 계산 (예: RSI 값)
-                # -------------------------------------------------
-                try:
-                    if hasattr(self, "indicator_engine"):
-                        rsi_val = self.indicator_engine.rsi(market, tf, period=14)
-
-                        if rsi_val is not None:
-                            # 왼쪽/게이지 숫자 라벨
-                            if hasattr(self, "var_rsi_value"):
-                                self.var_rsi_value.set(f"{rsi_val:5.2f}")
-
-                            # 🔹 게이지용 값 (0~100으로 클램프)
-                            rsi_clamped = max(0.0, min(100.0, float(rsi_val)))
-
-                            # 존 / 스타일 결정
-                            zone_text = "중립"
-                            style_name = "RSI.Neutral.Horizontal.TProgressbar"
-                            if rsi_clamped <= 30:
-                                zone_text = "과매도"
-                                style_name = "RSI.Cold.Horizontal.TProgressbar"
-                            elif rsi_clamped >= 70:
-                                zone_text = "과매수"
-                                style_name = "RSI.Hot.Horizontal.TProgressbar"
-
-                            # 상태 텍스트 (게이지 오른쪽)
-                            if hasattr(self, "var_rsi_status"):
-                                try:
-                                    self.var_rsi_status.set(zone_text)
-                                except Exception:
-                                    pass
-
-                            # 실제 Progressbar 값/스타일 반영
-                            if hasattr(self, "rsi_bar") and self.rsi_bar is not None:
-                                try:
-                                    self.rsi_bar["value"] = rsi_clamped
-                                    self.rsi_bar.configure(style=style_name)
-                                except Exception:
-                                    pass
-
-                except Exception:
-                    # RSI 계산 에러 시, 라벨이 있으면 에러 표시
-                    if hasattr(self, "var_rsi_value"):
-                        try:
-                            self.var_rsi_value.set("RSI 오류")
-                        except Exception:
-                            pass
-
-                # -------------------------------------------------
-                # 3) ChartEngine 업데이트
-                # -------------------------------------------------
-                try:
-                    if hasattr(self, "chart_engine") and candles:
+            # -------------------------------------------------
+            # 2) IndicatorEngine 계산 (예: RSI 값)
+            # -------------------------------------------------
+            try:
+                rsi_val = self.indicator_engine.rsi_incremental(market, tf, period=14)
+
+                if rsi_val is not None:
+                    # 왼쪽/게이지 숫자 라벨
+                    self._set_var(self.var_rsi_value, f"{rsi_val:5.2f}")
+
+                    # 🔹 게이지용 값 (0~100으로 클램프)
+                    rsi_clamped = max(0.0, min(100.0, float(rsi_val)))
+
+                    # 존 / 스타일 결정 (RSI_ZONES 테이블에서 한 번에)
+                    zone_idx = (rsi_clamped > RSI_OVERSOLD) + (rsi_clamped >= RSI_OVERBOUGHT)
+                    zone_text, style_name = RSI_ZONES[zone_idx]
+
+                    # 상태 텍스트 (게이지 오른쪽)
+                    self._set_var(self.var_rsi_status, zone_text)
+
+                    # 실제 Progressbar 값/스타일 반영 (바뀐 것만, 값은 0.1 이상 움직였을 때)
+                    self._set_rsi_bar(rsi_clamped, style_name)
+
+            except Exception as exc:
+                # RSI 계산 에러 시 라벨에 에러 표시
+                logging.error("RSI 계산 오류: market=%s tf=%s err=%s", market, tf, exc)
+                self._set_var(self.var_rsi_value, "RSI 오류")
+
+            # -------------------------------------------------
+            # 3) ChartEngine 업데이트
+            # -------------------------------------------------
+            # - 이미 그린 데이터면 생략
+            # - 같은 심볼/TF는 chart_min_interval_sec 안에 다시 그리지 않음 (심볼/TF 변경은 즉시)
+            #   → 미뤄진 경우 _last_seen_key를 남기지 않아 다음 틱에서 다시 시도
+            chart_pending = False
+            chart_key = (market, tf, last_refresh)
+            try:
+                if candles:
+                    now_ts = time.time()
+                    throttled = (
+                        self._last_chart_key is not None
+                        and self._last_chart_key[:2] == (market, tf)
+                        and now_ts - self._last_chart_redraw_ts < self.cfg.chart_min_interval_sec
+                    )
+                    if chart_key == self._last_chart_key:
+                        pass
+                    elif throttled:
+                        chart_pending = True
+                    else:
                         chart_status_msg = self.chart_engine.update(
                             candles=candles,
                             market=market,
                             tf=tf,
                             last_refresh=last_refresh,
+                            arrays=data.get("arr"),
                         )
-                        if hasattr(self, "var_chart_status") and isinstance(
-                            chart_status_msg,
-                            str,
-                        ):
-                            self.var_chart_status.set(chart_status_msg)
-                    else:
-                        # 차트 엔진이 없거나 캔들이 비어 있으면 상태 간단 표시
-                        if hasattr(self, "var_chart_status") and not candles:
-                            self.var_chart_status.set("차트: 캔들 데이터 없음")
-                except Exception as exc:
-                    if hasattr(self, "var_chart_status"):
-                        try:
-                            self.var_chart_status.set(f"차트 오류: {exc}")
-                        except Exception:
-                            pass
-
-            finally:
-                # -------------------------------------------------
-                # 4) 다음 틱 예약 (루프가 끊기지 않게 무조건 실행)
-                # -------------------------------------------------
-                try:
-                    self.after(REFRESH_MS, _tick)
-                except Exception:
-                    # 위젯이 이미 파괴된 경우 등은 그냥 조용히 무시
-                    pass
-        # 최초 1회 즉시 실행
-        _tick()
+                        self._last_chart_key = chart_key
+                        self._last_chart_redraw_ts = now_ts
+                        if isinstance(chart_status_msg, str):
+                            self._set_var(self.var_chart_status, chart_status_msg)
+                else:
+                    # 캔들이 비어 있으면 상태 간단 표시
+                    self._set_var(self.var_chart_status, "차트: 캔들 데이터 없음")
+            except Exception as exc:
+                self._set_var(self.var_chart_status, f"차트 오류: {exc}")
 
+            self._last_seen_key = None if chart_pending else seen_key
 
-    def _refresh_ui_safe(self) -> None:
-        try:
-            self._update_rsi_block()
-            self._update_chart_block()
-        except Exception as e:
-            logging.error(f"UI refresh error: {e!r}")
         finally:
-            self.after(1000, self._refresh_ui_safe)
-
-    # ---- 차트 갱신 ----
-    def _update_chart_block(self) -> None:
-        """현재 심볼/TF에 대한 차트 갱신 (ChartEngine 호출)."""
-        now_ts = time.time()
-        if self._last_chart_redraw_ts is not None:
-            if now_ts - self._last_chart_redraw_ts < 2.0:
-                return
-        self._last_chart_redraw_ts = now_ts
-
-        try:
-            market = self.var_symbol.get().strip()
-        except Exception:
-            market = ""
-
-        try:
-            tf = self.var_tf.get().strip()
-        except Exception:
-            tf = ""
-
-        if not market or not tf:
-            self.var_chart_status.set("차트: 심볼/TF 선택 필요")
-            return
-
-        data = self.data_engine.get(market, tf)
-        if not data or "candles" not in data:
-            self.var_chart_status.set("차트: 데이터 없음 (캐시 미존재)")
-            return
-
-        candles: list[dict] = data["candles"]
-        if not candles:
-            self.var_chart_status.set("차트: 캔들 데이터 비어 있음")
-            return
-
-        last_refresh = data.get("last_refresh")
-        status_text = self.chart_engine.update(candles, market, tf, last_refresh)
-        self.var_chart_status.set(status_text)
-
-    # ---- RSI 갱신 ----
-    def _update_rsi_block(self) -> None:
-        try:
-            market = self.var_symbol.get().strip()
-        except Exception:
-            market = ""
-
-        try:
-            tf = self.var_tf.get().strip()
-        except Exception:
-            tf = ""
-
-        if not market or not tf:
-            self.var_rsi_value.set("---")
-            self.var_rsi_status.set("심볼/TF 선택 필요")
-            return
-
-        rsi_value = self.indicator_engine.rsi(market, tf, period=14)
-        if rsi_value is None:
-            self.var_rsi_value.set("---")
-            self.var_rsi_status.set("데이터 부족")
-            return
-
-        self.var_rsi_value.set(f"{rsi_value:5.2f}")
-
-        try:
-            value = float(rsi_value)
-        except Exception:
-            value = 50.0
-
-        self.rsi_bar["value"] = value
-
-        if value >= 70:
-            self.var_rsi_status.set("과열 구간(매도 관찰)")
-        elif value <= 30:
-            self.var_rsi_status.set("과매도 구간(매수 관찰)")
-        else:
-            self.var_rsi_status.set("중립")
+            # -------------------------------------------------
+            # 4) 다음 틱 예약 (루프가 끊기지 않게 무조건 실행)
+            # -------------------------------------------------
+            try:
+                self._ui_after_id = self.after(UI_REFRESH_MS, self._ui_tick)
+            except Exception:
+                # 위젯이 이미 파괴된 경우 등은 그냥 조용히 무시
+                pass
 
     # ---------- Data Refresh Loop ----------
     def _start_data_refresh_loop(self) -> None:
+        """
+        고정 주기 대신, DataEngine이 알려주는 다음 갱신 시점(캔들 경계/오래됨)에 맞춰 예약한다.
+        - refresh_all은 백그라운드 스레드에서 돌고, Tk 스레드는 완료 여부만 짧게 확인
+        - 새 캔들이 들어오면 <<CandleTick>> 이벤트로 UI 틱을 바로 깨운다
+        """
+        market = self.var_symbol.get()
+        tfs = list(self.cfg.timeframes)
+        future = self._data_pool.submit(self.data_engine.refresh_all, market, tfs)
+        self.after(DATA_POLL_MS, self._on_data_refresh_done, future, market, tfs)
+
+    def _on_data_refresh_done(self, future: Future, market: str, tfs: list[str]) -> None:
+        # Tk 호출은 Tk 스레드에서만: 워커 콜백 대신 after로 완료를 확인한다
+        if not future.done():
+            self.after(DATA_POLL_MS, self._on_data_refresh_done, future, market, tfs)
+            return
+
+        changed = False
         try:
-            self.data_engine.refresh_all(
-                self.var_symbol.get(),
-                self.cfg.timeframes,
-            )
+            changed = future.result()
         except Exception as e:
             logging.error("데이터 갱신 오류: %s", e)
 
-        self.after(3000, self._start_data_refresh_loop)
+        if changed:
+            self.event_generate("<<CandleTick>>", when="tail")
+
+        delay_ms = int(self.data_engine.seconds_until_due(market, tfs) * 1000)
+        delay_ms = max(DATA_REFRESH_MIN_MS, min(DATA_REFRESH_MAX_MS, delay_ms))
+        self.after(delay_ms, self._start_data_refresh_loop)
 
     # ---------- 이벤트 ----------
     def _on_toggle_auto_trading(self) -> None: